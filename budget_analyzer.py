@@ -1,20 +1,75 @@
-import pandas as pd
-import statistics
+import functools
+import numbers
+import numpy as np
 import json
 import logging
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(filename='budgetanalyzer.log', level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
                     filemode='w')
 
 
+def _sum_by_code(codes: np.ndarray, amounts: np.ndarray, ngroups: int) -> np.ndarray:
+    """
+    Sums amounts per integer category code. np.bincount does the accumulation in C,
+    so there is no per-row dict lookup on the category string.
+
+    Returns:
+        np.ndarray: The summed amount for each code, indexed by code
+    """
+    return np.bincount(codes, weights=amounts, minlength=ngroups)
+
+
+def _encode(values: List) -> Tuple[np.ndarray, List]:
+    """
+    Encodes values as integer codes in first-seen order. A dict is used for the lookup,
+    so any hashable category works, including None.
+
+    Returns:
+        Tuple[np.ndarray, List]: The code for each value and the distinct values,
+                                 indexed by code
+    """
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.intp, count=len(values))
+    return codes, list(index)
+
+
+def _memoized(method):
+    """
+    Caches the result of a BudgetAnalyzer method in the instance's _cache, so repeated
+    calls return the stored value until BudgetAnalyzer.invalidate() is called.
+    Dicts and lists are returned as shallow copies so callers cannot change the cached
+    value. A cache hit therefore costs one copy of the result: O(C) for the per-category
+    dicts, and O(N) for the list returned by transaction_description.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        try:
+            result = self._cache[method.__name__]
+        except KeyError:
+            result = self._cache[method.__name__] = method(self)
+        if isinstance(result, (dict, list)):
+            return result.copy()
+        return result
+    return wrapper
+
+
 class Transaction:
     """
     Represents a financial transaction.
+
+    Attributes are stored in __slots__ rather than a per-instance __dict__ to keep
+    large lists of transactions small.
     """
+    __slots__ = ('date', 'amount', 'category')
 
-    def __init__(self, date: str, amount: float, category: str):
+    def __init__(self, date: Union[str, datetime, np.datetime64], amount: float, category: str):
         """
         Constructor for creating Transaction objects.
 
@@ -22,12 +77,22 @@ class Transaction:
         or classes that interact with Transaction objects or takes in the the objects as an argument.
     
         Parameters:
-        date (str): The date of the transaction
+        date (str | datetime | np.datetime64): The date of the transaction, either as a
+                               "%Y-%m-%d" string or an already parsed date. It is stored
+                               as a day-precision np.datetime64
         amount (float): The transaction amount
         category (str): The category assigned to the transaction
+
+        Raises:
+            ValueError: If a string date does not match "%Y-%m-%d" or the date is NaT
     
         """
-        self.date = datetime.strptime(date, "%Y-%m-%d")
+        if isinstance(date, str):
+            date = datetime.strptime(date, "%Y-%m-%d")
+        date = np.datetime64(date, 'D')
+        if np.isnat(date):
+            raise ValueError("Transaction date must not be NaT")
+        self.date = date
         self.amount = amount
         self.category = category
 
@@ -36,7 +101,7 @@ class Transaction:
         Returns a readable string representation of the Transaction objects,
         useful for debugging and understanding the object's contents.
         """
-        repr = f"<Transaction {self.amount} {self.category} on {self.date.date()}>"
+        repr = f"<Transaction {self.amount} {self.category} on {self.date}>"
         return repr  # noqa: E501
 
     def is_expense(self):
@@ -60,8 +125,34 @@ class BudgetAnalyzer:
         transactions (List[Transaction]): A list of Transaction instances to be analyzed
         """
         self.transactions = transactions 
-        
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Rebuilds the column arrays from self.transactions and clears the cached results.
+        Call this after adding, removing or changing transactions.
 
+        Raises:
+            TypeError: If a transaction amount is not a real number
+        """
+        transactions = self.transactions
+        # Column arrays extracted once so the aggregations below run as vectorized
+        # reductions instead of per-object Python loops
+        values = [t.amount for t in transactions]
+        amounts = np.array(values)
+        if amounts.dtype.kind not in 'biuf':
+            # Only non-numeric values or ints too wide for int64 get here; the latter are fine
+            for amount in values:
+                if not isinstance(amount, numbers.Real):
+                    raise TypeError(f"Transaction amount must be a number, got {amount!r}")
+        self._amt = amounts.astype(np.float64)
+        self._cat = [t.category for t in transactions]
+        self._cat_codes, self._cat_labels = _encode(self._cat)
+        self._date = np.array([t.date for t in transactions], dtype='datetime64[D]')
+        self._expense_mask = self._amt < 0
+        self._cache = {}
+
+    @_memoized
     def total_spent(self) -> float:
         """
         Calculates sum total of expenses. i.e amounts less than 0
@@ -69,9 +160,10 @@ class BudgetAnalyzer:
         Returns:
             float:The total expenses
         """
-        total_spends = sum(t.amount for t in self.transactions if t.is_expense())
+        total_spends = float(self._amt[self._expense_mask].sum())
         return total_spends
 
+    @_memoized
     def total_earned(self) -> float:
         """
         Calculates sum total of amounts earned. i.e amounts > 0
@@ -79,43 +171,50 @@ class BudgetAnalyzer:
         Returns:
             float: The total earnings
         """
-        total_earning = sum(t.amount for t in self.transactions if not t.is_expense())
+        total_earning = float(self._amt[~self._expense_mask].sum())
         return total_earning
 
+    @_memoized
     def spending_by_category(self) -> Dict[str, float]:
         """
-        Calculates total spends for each category
+        Calculates total spends for each category, listed in the order each category's
+        first expense appears
 
         Returns: 
             Dict[str, float]: A dictionary where keys are categories and values are the 
                             total spend for each category
         """
-        summary = {}
-        for t in self.transactions:
-            if t.is_expense():
-                summary[t.category] = summary.get(t.category, 0) + abs(t.amount)  # noqa: E501
+        m = self._expense_mask
+        codes = self._cat_codes[m]
+        sums = _sum_by_code(codes, -self._amt[m], len(self._cat_labels)).tolist()
+        present, first_seen = np.unique(codes, return_index=True)
+        summary = {self._cat_labels[c]: sums[c] for c in present[np.argsort(first_seen)].tolist()}
         return summary
     
     # New added methods
+    @_memoized
     def average_daily_spending(self) -> float:
         """
         Calculates the average daily spend
 
-        It sums the total expenses for each day and then divides by the number of
-        days 
+        It sums the total expenses for each calendar day and then divides by the number of
+        days with expenses. Days are bucketed by their ordinal so the sums are a single
+        np.bincount
 
         Returns:
-            float: The average amount spent per day
+            float: The average amount spent per day, or 0.0 when there are no expenses
         """
-        avg_daily = {}
-        for t in self.transactions:
-            if t.is_expense():
-                avg_daily[t.date] = avg_daily.get(t.date, 0) + abs(t.amount)
+        m = self._expense_mask
+        if not m.any():
+            return 0.0
+        day_ords = self._date[m].astype(np.int64)
+        avg_daily = np.bincount(day_ords - day_ords.min(), weights=-self._amt[m])
         
-        daily_avg = sum(avg_daily.values()) / len(avg_daily)
+        daily_avg = float(avg_daily[avg_daily > 0].mean())
         return daily_avg
         
     
+    @_memoized
     def Number_of_transactions_per_category(self) -> Dict[str, int]:
         """
         Calculates the number of transactions for each category
@@ -124,49 +223,62 @@ class BudgetAnalyzer:
             Dict[str, int]: A dictionary where keys are categories and values are the 
                             number of transactions in each category
         """
-        categories = {}
-        for t in self.transactions:
-            categories [t.category] = categories.get(t.category, 0) + 1
+        counts = np.bincount(self._cat_codes, minlength=len(self._cat_labels))
+        categories = dict(zip(self._cat_labels, counts.tolist()))
         return categories 
         
     
-    def transaction_description(self) -> List[Transaction]:
+    @_memoized
+    def transaction_description(self) -> List[str]:
         """
-        Adds a description (Debit or Credit) to each transaction based on whether 
-        it is an expense or not, and returns the updated list of transactions
+        Describes each transaction as a Debit or Credit based on whether 
+        it is an expense or not. Amounts and categories are formatted from the transactions
+        as given, while the Debit/Credit test and the dates come from the column arrays
+
+        The result is cached, but each call returns a new copy of the N-element list.
 
         Returns:
-            List[Transaction]: A list of transactions with added descriptions.    
-        """
-        descriptions = []
-        for t in self.transactions:
-            if t.is_expense():
-                t.description = 'Debit'
-                
-            else:
-                t.description = 'Credit'
-            fields = f"Transaction {t.amount} {t.category} on {t.date.date()} - {t.description}"
-            descriptions.append(fields)
+            List[str]: A description line for each transaction.    
+        """
+        descriptions = [f"Transaction {t.amount} {t.category} on {d} - {'Debit' if e else 'Credit'}"
+                        for t, d, e in zip(self.transactions, self._date.tolist(), self._expense_mask.tolist())]
         return descriptions 
+
+    def _compute_all(self):
+        """
+        Collects every figure used by print_summary. Each one comes from its memoized
+        method, so a figure already computed by an earlier call is not computed again.
+        The tuple itself is not cached, so every call gets fresh copies of the dicts and lists
+
+        Returns:
+            tuple: total spent, total earned, spending by category, average daily spend,
+                   number of transactions per category and the transaction descriptions
+        """
+        return (self.total_spent(), self.total_earned(), self.spending_by_category(),
+                self.average_daily_spending(), self.Number_of_transactions_per_category(),
+                self.transaction_description())
         
     # Updated method to call new added methods and log them 
     def print_summary(self):
         """
         Calls methods and prints a summary of their outputs. Logs the results for tracking.
+
+        The report is built up as a list of lines and logged as a single record, so the
+        logging lock and file write are paid once rather than once per line.
         """
-        logging.info("------ Budget Summary ------")
-        logging.info(f"Total Earned: ${self.total_earned():.2f}")
-        logging.info(f"Total Spent:  ${abs(self.total_spent()):.2f}")
-        logging.info("Spending by Category:")
-        for category, amount in self.spending_by_category().items():
-            logging.info(f"  {category}: ${amount:.2f}")
-        logging.info(f"Average daily spend: ${self.average_daily_spending():.2f}")
-        logging.info("Number of transactions per category:")
-        for key in self.Number_of_transactions_per_category():
-            values = self.Number_of_transactions_per_category()[key]
-            logging.info(f"{key}: {values}")
-        for t in self.transaction_description():
-            logging.info(f" {t}")
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        spent, earned, by_cat, daily_avg, count_cat, descriptions = self._compute_all()
+        lines = ["------ Budget Summary ------",
+                 f"Total Earned: ${earned:.2f}",
+                 f"Total Spent:  ${abs(spent):.2f}",
+                 "Spending by Category:"]
+        lines.extend(f"  {category}: ${amount:.2f}" for category, amount in by_cat.items())
+        lines.append(f"Average daily spend: ${daily_avg:.2f}")
+        lines.append("Number of transactions per category:")
+        lines.extend(f"{key}: {values}" for key, values in count_cat.items())
+        lines.extend(f" {t}" for t in descriptions)
+        logging.info("\n".join(lines))
 
 
 def load_transactions(filepath: str) -> List[Transaction]:
@@ -177,11 +289,28 @@ def load_transactions(filepath: str) -> List[Transaction]:
         {"date": "2024-05-01", "amount": -50.25, "category": "groceries"},
         {"date": "2024-05-02", "amount": 2000.00, "category": "salary"}
     ]
+
+    The file is parsed with orjson when it is installed. Files orjson rejects but the
+    standard json module accepts (NaN, Infinity, integers wider than 64 bits) are
+    re-parsed with json, so the result does not depend on orjson being installed.
+
+    Each distinct date string is parsed once with strptime("%Y-%m-%d"), so files with
+    repeated dates pay for one parse per day rather than one per record.
     """
     try:
-        with open(filepath, "r") as f:
-            data = json.load(f)
-            return [Transaction(**item) for item in data]
+        with open(filepath, "rb") as f:
+            raw = f.read()
+            decoded = False
+            if orjson is not None:
+                try:
+                    data = orjson.loads(raw)
+                    decoded = True
+                except orjson.JSONDecodeError:
+                    pass
+            if not decoded:
+                data = json.loads(raw)
+            dates = {d: datetime.strptime(d, "%Y-%m-%d") for d in dict.fromkeys(item["date"] for item in data)}
+            return [Transaction(**{**item, "date": dates[item["date"]]}) for item in data]
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logging.error(f"Failed to load transactions: {e}")
         return []